@@ -7,31 +7,97 @@ Clean Python script version with proper indentation
 # Import required libraries
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime, timedelta
-import pandas_datareader.data as web
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import argparse
+import contextlib
+import functools
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+import sys
 import warnings
 
-warnings.filterwarnings('ignore')
+# Heavier dependencies (matplotlib, seaborn, duckdb, requests_cache, pandas_datareader,
+# numba) are imported inside the functions that use them, keeping module import to pandas/numpy
 
-# Set plotting style
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+warnings.filterwarnings('ignore')
 
 print("Libraries imported successfully!")
 print("📊 FRED Data Reader configured for real-time federal debt analysis")
-print(f"Analysis date: {datetime.now().strftime('%Y-%m-%d')}")
+# Clock read once per run; main() passes it down so every date decision agrees
+ANALYSIS_TIME = datetime.now()
+print(f"Analysis date: {ANALYSIS_TIME:%Y-%m-%d}")
+
+# FRED publishes these series at most quarterly, so cached downloads stay valid for hours
+FRED_CACHE_EXPIRE = timedelta(hours=12)
+
+# Assembled quarterly frame, reloaded instead of re-fetched while it is fresh
+FEDERAL_DEBT_CACHE = Path('federal_debt.parquet')
+FEDERAL_DEBT_MAX_AGE = timedelta(hours=24)
+
+# Raw downloads, one Parquet file per FRED series
+FRED_SERIES_DIR = Path('fred_series')
+
+# Rendered charts, keyed by a hash of the plotted data; only the most recent few are kept
+VIZ_CACHE_DIR = '.viz_cache'
+VIZ_CACHE_KEEP = 5
+
+# Interest burden risk zones: a burden above each threshold moves up one label
+_RISK_THRESHOLDS = np.array([10., 15., 20.])
+_RISK_LABELS = np.array(['✅ MANAGEABLE', '⚡ MODERATE', '⚠️  HIGH RISK', '🚨 CRITICAL'])
+
 
+def classify_series(arr):
+    """Map interest burden values (% of revenue) to risk labels"""
+    return _RISK_LABELS[np.searchsorted(_RISK_THRESHOLDS, arr)]
 
-def fetch_federal_debt_data():
-    """Fetch real federal debt data from FRED API"""
+
+def _add_derived_metrics(df):
+    """Add interest burden, debt-to-GDP and implied average rate columns in place"""
+    ip = df['interest_payments'].to_numpy()
+    tr = df['total_receipts'].to_numpy()
+    td = df['total_debt'].to_numpy()
+    gdp = df['gdp'].to_numpy()
+    
+    df[['interest_burden_pct', 'debt_to_gdp', 'implied_avg_rate']] = np.column_stack([
+        ip / tr * 100,       # Interest Burden: The Core Metric!
+        td / gdp * 100,      # Debt-to-GDP ratio
+        ip * 4 / td * 100,   # Implied average interest rate on federal debt (annualized)
+    ])
+    return df
+
+
+def fetch_federal_debt_data(refresh=False, end_date=None, now=None):
+    """Fetch real federal debt data from FRED API (refresh=True bypasses the Parquet and HTTP caches)"""
+    if now is None:
+        now = datetime.now()
+    
+    # The Parquet cache holds data up to today; other end dates always fetch and are never cached
+    today = now.strftime('%Y-%m-%d')
+    if end_date is None:
+        end_date = today
+    use_cache = end_date == today
+    
+    if (not refresh and use_cache and FEDERAL_DEBT_CACHE.is_file() and
+            now - datetime.fromtimestamp(FEDERAL_DEBT_CACHE.stat().st_mtime) < FEDERAL_DEBT_MAX_AGE):
+        print(f"⚡ Loading cached federal debt data from {FEDERAL_DEBT_CACHE}...")
+        try:
+            return pd.read_parquet(FEDERAL_DEBT_CACHE)
+        except (OSError, ValueError) as e:
+            # Unreadable cache (e.g. corrupt or truncated): treat as a miss and re-fetch
+            print(f"   ⚠️  Warning: Could not read {FEDERAL_DEBT_CACHE}, re-fetching: {e}")
+    
+    import duckdb
+    import pandas_datareader.data as web
+    import requests_cache
+    
     print("🚀 Fetching REAL federal debt data from FRED...")
     print("This may take a moment for the first run...")
     
     # Define date range for analysis
     start_date = '1990-01-01'
-    end_date = datetime.now().strftime('%Y-%m-%d')
     
     try:
         # FRED Series IDs for key federal debt metrics
@@ -46,58 +112,123 @@ def fetch_federal_debt_data():
         
         print(f"📡 Downloading {len(series_dict)} key economic series from FRED...")
         
-        # Download data from FRED
+        # Download data from FRED concurrently, sharing one on-disk cached session across threads
         fred_data = {}
-        for name, series_id in series_dict.items():
-            try:
-                print(f"   • Fetching {name} ({series_id})...")
-                fred_data[name] = web.DataReader(series_id, 'fred', start_date, end_date)
-            except Exception as e:
-                print(f"   ⚠️  Warning: Could not fetch {name}: {e}")
-                # Create fallback data if series fails
-                dates = pd.date_range(start_date, end_date, freq='Q')
-                fred_data[name] = pd.DataFrame(index=dates, columns=[series_id])
-                fred_data[name][series_id] = np.nan
+        failed = []
+        fallback_dates = pd.date_range(start_date, end_date, freq='Q')
+        # autoclose=False: DataReader closes its session after each read, which would otherwise
+        # shut the shared SQLite backend while other threads are still using it
+        session = requests_cache.CachedSession('.fred_cache', expire_after=FRED_CACHE_EXPIRE, autoclose=False)
+        try:
+            if refresh:
+                session.cache.clear()
+            with ThreadPoolExecutor(max_workers=len(series_dict)) as executor:
+                futures = {
+                    executor.submit(web.DataReader, series_id, 'fred', start_date, end_date, session=session): name
+                    for name, series_id in series_dict.items()
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    series_id = series_dict[name]
+                    try:
+                        fred_data[name] = future.result()
+                        print(f"   • Fetched {name} ({series_id})")
+                    except Exception as e:
+                        print(f"   ⚠️  Warning: Could not fetch {name}: {e}")
+                        failed.append(name)
+                        # Create fallback data if series fails
+                        fred_data[name] = pd.DataFrame(
+                            {series_id: np.full(len(fallback_dates), np.nan, dtype='float32')}, index=fallback_dates
+                        )
+        finally:
+            session.cache.close()
         
         print("✅ Data download complete!")
         
-        # Convert to quarterly frequency and align all series
-        df_quarterly = pd.DataFrame()
-        
-        # Process each series
-        for name, data in fred_data.items():
-            if not data.empty:
-                # Resample to quarterly and take last value of period
-                quarterly_data = data.resample('Q').last()
-                df_quarterly[name] = quarterly_data.iloc[:, 0]
-        
-        # Remove rows with too many missing values
-        df_quarterly = df_quarterly.dropna(thresh=4)
-        
-        # Calculate key derived metrics
-        df_federal = df_quarterly.copy()
+        # Long (date, metric, value) frame per series; metric is categorical so the files stay
+        # dictionary-encoded
+        metric_dtype = pd.CategoricalDtype(list(series_dict))
+        series_long = {
+            series_id: pd.DataFrame({
+                'date': fred_data[name].index.astype('datetime64[ns]'),
+                'metric': pd.Categorical([name] * len(fred_data[name]), dtype=metric_dtype),
+                'value': fred_data[name].iloc[:, 0].to_numpy(dtype='float64'),
+            })
+            for name, series_id in series_dict.items()
+            if not fred_data[name].empty
+        }
         
-        # Interest Burden: The Core Metric!
-        df_federal['interest_burden_pct'] = (
-            df_federal['interest_payments'] / df_federal['total_receipts']
-        ) * 100
+        # Persist each series as its own Parquet file, keyed by series ID
+        try:
+            FRED_SERIES_DIR.mkdir(exist_ok=True)
+            series_files = []
+            for series_id, df_series in series_long.items():
+                path = FRED_SERIES_DIR / f'{series_id}.parquet'
+                df_series.to_parquet(path, compression='zstd', index=False)
+                series_files.append(str(path))
+        except OSError as e:
+            print(f"   ⚠️  Warning: Could not write series files to {FRED_SERIES_DIR}: {e}")
+            series_files = None
         
-        # Debt-to-GDP ratio
-        df_federal['debt_to_gdp'] = (df_federal['total_debt'] / df_federal['gdp']) * 100
+        # Quarterly alignment and derived metrics in one DuckDB query over the series files:
+        # last reported value per quarter (labelled with the quarter end, like resample('Q')),
+        # drop quarters with fewer than 4 series, pivot to wide
+        metrics = ', '.join(f"'{name}'" for name in series_dict)
+        with duckdb.connect() as con:
+            if series_files is not None:
+                con.read_parquet(series_files).create_view('fred_long')
+            else:
+                # Series files unavailable: query the same long data from memory
+                con.register('fred_long', pd.concat(series_long.values(), ignore_index=True))
+            df_federal = con.execute(f"""
+                WITH quarterly AS (
+                    SELECT date_trunc('quarter', date) + INTERVAL 3 MONTH - INTERVAL 1 DAY AS date,
+                           metric, arg_max(value, date) AS value
+                    FROM fred_long
+                    WHERE value IS NOT NULL
+                    GROUP BY ALL
+                ),
+                complete AS (
+                    SELECT * FROM quarterly
+                    QUALIFY count(*) OVER (PARTITION BY date) >= 4
+                ),
+                wide AS (
+                    PIVOT complete ON metric IN ({metrics}) USING first(value) GROUP BY date
+                )
+                SELECT *,
+                    interest_payments / total_receipts * 100 AS interest_burden_pct,  -- The Core Metric!
+                    total_debt / gdp * 100 AS debt_to_gdp,
+                    interest_payments * 4 / total_debt * 100 AS implied_avg_rate       -- Annualized
+                FROM wide
+                WHERE interest_burden_pct IS NOT NULL AND total_debt IS NOT NULL AND total_receipts IS NOT NULL
+                ORDER BY date
+            """).df().set_index('date')
         
-        # Implied average interest rate on federal debt
-        df_federal['implied_avg_rate'] = (
-            df_federal['interest_payments'] * 4 / df_federal['total_debt']
-        ) * 100  # Annualized
+        # FRED values carry only a few significant digits, so float32 halves memory and bandwidth
+        num_cols = df_federal.select_dtypes('float64').columns
+        df_federal[num_cols] = df_federal[num_cols].astype('float32')
         
-        # Clean the data
-        df_federal = df_federal.dropna(subset=['interest_burden_pct', 'total_debt', 'total_receipts'])
+        # Arrow-backed columns: smaller nullable storage and Arrow compute kernels for reductions
+        if int(pd.__version__.split('.')[0]) >= 2:
+            # convert_integer=False keeps whole-number float series as floats
+            df_federal = df_federal.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
         
         print("\n📊 REAL FEDERAL DEBT DATA LOADED SUCCESSFULLY!")
-        print(f"   • Data Range: {df_federal.index[0].strftime('%Y-%m')} to {df_federal.index[-1].strftime('%Y-%m')}")
+        print(f"   • Data Range: {str(df_federal.index[0])[:7]} to {str(df_federal.index[-1])[:7]}")
         print(f"   • Total Quarters: {len(df_federal)}")
         print(f"   • Current Interest Burden: {df_federal['interest_burden_pct'].iloc[-1]:.2f}% of revenue")
         
+        # Only cache complete up-to-date downloads, and never let a failed cache write discard real data
+        if use_cache and not failed:
+            # Write to a temporary file and swap it in, so an interrupted write never leaves a broken cache
+            tmp_path = FEDERAL_DEBT_CACHE.with_name(f'.{FEDERAL_DEBT_CACHE.name}.{os.getpid()}.tmp')
+            try:
+                df_federal.to_parquet(tmp_path, compression='zstd', index=True)
+                os.replace(tmp_path, FEDERAL_DEBT_CACHE)
+            except OSError as e:
+                print(f"   ⚠️  Warning: Could not cache data to {FEDERAL_DEBT_CACHE}: {e}")
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink(missing_ok=True)
         return df_federal
         
     except Exception as e:
@@ -106,89 +237,194 @@ def fetch_federal_debt_data():
         return create_demo_data()
 
 
+def _make_simulate(prange):
+    """Build the simulation kernel, looping over trials with the given range function"""
+    def simulate(n_trials, n_periods, seeds):
+        """Simulate receipts, debt, 10Y rates and interest payments; one trajectory per row"""
+        receipts = np.empty((n_trials, n_periods))
+        debt = np.empty((n_trials, n_periods))
+        rates = np.empty((n_trials, n_periods))
+        interest = np.empty((n_trials, n_periods))
+        
+        for i in prange(n_trials):
+            np.random.seed(seeds[i])
+            
+            # Create realistic federal data patterns (first period is the base level)
+            acc = 800.0  # Starting receipts in billions
+            for t in range(n_periods):
+                growth = np.random.normal(1.02, 0.05)
+                if t > 0:
+                    acc *= growth
+                receipts[i, t] = acc
+            
+            # Debt grows faster than receipts (realistic pattern)
+            acc = 3000.0  # Starting debt in billions
+            for t in range(n_periods):
+                growth = np.random.normal(1.025, 0.03)
+                if t > 0:
+                    acc *= growth
+                debt[i, t] = acc
+            
+            # Treasury rates vary over time (realistic cycle)
+            for t in range(n_periods):
+                cycle = np.sin(4 * np.pi * t / max(n_periods - 1, 1)) * 2 + 4
+                rates[i, t] = max(cycle + np.random.normal(0, 0.5), 0.1)
+            
+            # Interest payments based on debt and average rates (floored at 0.5%)
+            for t in range(n_periods):
+                avg_debt_rate = max(rates[i, t] * 0.8 + np.random.normal(0, 0.3), 0.5)
+                interest[i, t] = debt[i, t] * avg_debt_rate / 400
+        
+        return receipts, debt, rates, interest
+    
+    return simulate
+
+
+# Plain Python kernel: cheapest for a single trajectory (no compilation or thread start-up)
+_simulate = _make_simulate(range)
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_simulate():
+    """Return the kernel JIT-compiled with numba for parallel ensembles, or the plain one without numba"""
+    try:
+        import numba
+    except ImportError:  # numba is optional; ensembles then run as plain Python
+        return _simulate
+    return numba.njit(parallel=True, fastmath=True, cache=True)(_make_simulate(numba.prange))
+
+
+def simulate_scenarios(n_trials, n_periods, seeds):
+    """Simulate n_trials seeded demo trajectories; arrays are shaped (n_trials, n_periods)"""
+    kernel = _simulate if n_trials == 1 else _jit_simulate()
+    return kernel(n_trials, n_periods, seeds)
+
+
 def create_demo_data():
     """Create realistic demonstration data"""
     # Create realistic demonstration data based on actual historical patterns
     years = pd.date_range('1990-01-01', '2024-10-01', freq='Q')
     n_periods = len(years)
     
-    # Set random seed for reproducible demo data
-    np.random.seed(42)
-    
-    # Create realistic federal data patterns
-    base_receipts = 800  # Starting point in billions
-    receipts_growth = np.random.normal(1.02, 0.05, n_periods)
-    total_receipts = [base_receipts]
-    for growth in receipts_growth[1:]:
-        total_receipts.append(total_receipts[-1] * growth)
-    
-    # Debt grows faster than receipts (realistic pattern)
-    base_debt = 3000  # Starting debt in billions
-    debt_growth = np.random.normal(1.025, 0.03, n_periods)
-    total_debt = [base_debt]
-    for growth in debt_growth[1:]:
-        total_debt.append(total_debt[-1] * growth)
-    
-    # Treasury rates vary over time (realistic cycle)
-    treasury_base = np.sin(np.linspace(0, 4*np.pi, n_periods)) * 2 + 4
-    treasury_10y = np.maximum(treasury_base + np.random.normal(0, 0.5, n_periods), 0.1)
-    
-    # Interest payments based on debt and average rates
-    avg_debt_rate = treasury_10y * 0.8 + np.random.normal(0, 0.3, n_periods)
-    avg_debt_rate = np.maximum(avg_debt_rate, 0.5)  # Floor at 0.5%
-    interest_payments = np.array(total_debt) * np.array(avg_debt_rate) / 400
+    # Single seeded trajectory from the simulation kernel for reproducible demo data
+    receipts, debt, rates, interest = simulate_scenarios(1, n_periods, np.array([42]))
+    total_receipts, total_debt, treasury_10y, interest_payments = receipts[0], debt[0], rates[0], interest[0]
     
     df_federal = pd.DataFrame({
         'total_receipts': total_receipts,
         'total_debt': total_debt,
         'treasury_10y': treasury_10y,
         'interest_payments': interest_payments,
-        'gdp': np.array(total_receipts) * 5.2  # Rough GDP multiplier
+        'gdp': total_receipts * 5.2  # Rough GDP multiplier
     }, index=years)
     
     # Calculate key metrics
-    df_federal['interest_burden_pct'] = (
-        df_federal['interest_payments'] / df_federal['total_receipts']
-    ) * 100
-    df_federal['debt_to_gdp'] = (df_federal['total_debt'] / df_federal['gdp']) * 100
-    df_federal['implied_avg_rate'] = (
-        df_federal['interest_payments'] * 4 / df_federal['total_debt']
-    ) * 100
+    df_federal = _add_derived_metrics(df_federal)
     
     print("✅ Realistic demonstration data created successfully!")
-    print(f"   • Data Range: {df_federal.index[0].strftime('%Y-%m')} to {df_federal.index[-1].strftime('%Y-%m')}")
+    print(f"   • Data Range: {str(df_federal.index[0])[:7]} to {str(df_federal.index[-1])[:7]}")
     print(f"   • Demo Interest Burden: {df_federal['interest_burden_pct'].iloc[-1]:.2f}% of revenue")
     print(f"   • Demo Peak Burden: {df_federal['interest_burden_pct'].max():.2f}% of revenue")
     
     return df_federal
 
 
+def _is_headless():
+    """True on Linux without a display, where no chart window can be shown"""
+    return sys.platform.startswith('linux') and not os.environ.get('DISPLAY')
+
+
+def _show_cached_chart(path):
+    """Display a cached chart; returns False if it could not be shown"""
+    try:
+        from IPython import get_ipython
+        from IPython.display import Image, display
+        if get_ipython() is not None:
+            display(Image(filename=path))
+            return True
+    except ImportError:
+        pass
+    
+    if _is_headless():
+        # Nothing to show on screen; the cached PNG is the output
+        return True
+    
+    # Plain script run on a desktop: open the PNG in the default image viewer
+    try:
+        if sys.platform.startswith('win'):
+            os.startfile(path)
+        else:
+            subprocess.Popen(['open' if sys.platform == 'darwin' else 'xdg-open', path])
+        return True
+    except OSError:
+        return False
+
+
+def _prune_viz_cache(keep=VIZ_CACHE_KEEP):
+    """Delete all but the most recently used cached charts"""
+    charts = sorted(Path(VIZ_CACHE_DIR).glob('*.png'), key=lambda p: p.stat().st_mtime, reverse=True)
+    for chart in charts[keep:]:
+        chart.unlink(missing_ok=True)
+
+
 def create_visualization(df_federal):
     """Create the main Interest Expense Burden visualization"""
     print("📊 Creating Interest Expense Burden visualization...")
     
-    plt.figure(figsize=(14, 8))
+    # Skip rebuilding the figure when the plotted data matches an already rendered chart
+    data_hash = pd.util.hash_pandas_object(df_federal[['interest_burden_pct']]).values.tobytes()
+    cache_key = hashlib.blake2b(data_hash, digest_size=8).hexdigest()
+    cache_path = os.path.join(VIZ_CACHE_DIR, f'{cache_key}.png')
+    if os.path.exists(cache_path) and _show_cached_chart(cache_path):
+        print(f"⚡ Data unchanged - reusing cached chart: {cache_path}")
+        os.utime(cache_path)  # Mark as recently used so pruning keeps it
+        return df_federal.iloc[-1]
+    
+    import matplotlib
+    
+    # Headless Linux runs (CI, notebook export) render straight to Agg instead of probing GUI toolkits
+    if _is_headless() and 'MPLBACKEND' not in os.environ and 'ipykernel' not in sys.modules:
+        matplotlib.use('Agg')
+    
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.lines import Line2D
+    import seaborn as sns
+    
+    # Set plotting style
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+    
+    fig, ax = plt.subplots(figsize=(14, 8))
+    yaxis = ax.get_yaxis_transform()  # x in axes fraction (full width), y in data units
     
     # Main chart
-    plt.plot(df_federal.index, df_federal['interest_burden_pct'],
-             linewidth=3, color='#d62728', marker='o', markersize=3, alpha=0.8)
+    ax.plot(df_federal.index, df_federal['interest_burden_pct'],
+            linewidth=3, color='#d62728', marker='o', markersize=3, alpha=0.8)
     
-    # Risk threshold lines
-    plt.axhline(y=20, color='red', linestyle='--', alpha=0.7, linewidth=2, label='Critical Level (20%)')
-    plt.axhline(y=15, color='orange', linestyle='--', alpha=0.7, linewidth=2, label='High Risk (15%)')
-    plt.axhline(y=10, color='gold', linestyle='--', alpha=0.7, linewidth=2, label='Moderate Risk (10%)')
-    plt.axhline(y=5, color='green', linestyle='--', alpha=0.5, linewidth=2, label='Comfortable (5%)')
+    # Risk threshold lines, drawn as a single collection
+    thresholds = [
+        (20, 'red', 0.7, 'Critical Level (20%)'),
+        (15, 'orange', 0.7, 'High Risk (15%)'),
+        (10, 'gold', 0.7, 'Moderate Risk (10%)'),
+        (5, 'green', 0.5, 'Comfortable (5%)'),
+    ]
+    ax.add_collection(LineCollection(
+        [[(0, y), (1, y)] for y, _, _, _ in thresholds],
+        colors=[to_rgba(color, alpha) for _, color, alpha, _ in thresholds],
+        linestyles='--', linewidths=2, transform=yaxis), autolim=False)
     
     # Highlight recent trend (last 5 years)
     recent_data = df_federal.tail(20)
-    plt.plot(recent_data.index, recent_data['interest_burden_pct'],
-             linewidth=6, color='darkred', alpha=0.6, label='Recent 5Y Trend')
+    recent_line, = ax.plot(recent_data.index, recent_data['interest_burden_pct'],
+                           linewidth=6, color='darkred', alpha=0.6, label='Recent 5Y Trend')
     
     # Current point highlighting
     current_point = df_federal.iloc[-1]
-    plt.scatter(current_point.name, current_point['interest_burden_pct'],
+    ax.scatter(current_point.name, current_point['interest_burden_pct'],
                s=200, color='red', zorder=5, edgecolor='black', linewidth=2)
-    plt.annotate(f'Current: {current_point["interest_burden_pct"]:.1f}%',
+    ax.annotate(f'Current: {current_point["interest_burden_pct"]:.1f}%',
                 xy=(current_point.name, current_point['interest_burden_pct']),
                 xytext=(20, 20), textcoords='offset points',
                 bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', alpha=0.9),
@@ -196,20 +432,35 @@ def create_visualization(df_federal):
                 fontsize=12, fontweight='bold')
     
     # Styling
-    plt.title('🎯 US Federal Interest Payments as % of Revenue\n(The Ultimate Fiscal Stress Indicator)',
-              fontsize=16, fontweight='bold', pad=20)
-    plt.ylabel('Interest Payments (% of Revenue)', fontsize=14, fontweight='bold')
-    plt.xlabel('Year', fontsize=14, fontweight='bold')
-    plt.legend(loc='upper left', fontsize=11)
-    plt.grid(True, alpha=0.3)
-    
-    # Add background shading for risk zones
-    plt.axhspan(20, 25, alpha=0.1, color='red', label='_nolegend_')
-    plt.axhspan(15, 20, alpha=0.1, color='orange', label='_nolegend_')
-    plt.axhspan(10, 15, alpha=0.1, color='gold', label='_nolegend_')
-    plt.axhspan(0, 10, alpha=0.05, color='green', label='_nolegend_')
-    
-    plt.tight_layout()
+    ax.set_title('🎯 US Federal Interest Payments as % of Revenue\n(The Ultimate Fiscal Stress Indicator)',
+                 fontsize=16, fontweight='bold', pad=20)
+    ax.set_ylabel('Interest Payments (% of Revenue)', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Year', fontsize=14, fontweight='bold')
+    threshold_handles = [
+        Line2D([], [], color=color, alpha=alpha, linestyle='--', linewidth=2, label=label)
+        for _, color, alpha, label in thresholds
+    ]
+    ax.legend(handles=threshold_handles + [recent_line], loc='upper left', fontsize=11)
+    ax.grid(True, alpha=0.3)
+    
+    # Add background shading for risk zones, drawn as a single collection
+    bands = [((20, 25), 'red', 0.1), ((15, 20), 'orange', 0.1), ((10, 15), 'gold', 0.1), ((0, 10), 'green', 0.05)]
+    ax.add_collection(PolyCollection(
+        [[(0, lo), (1, lo), (1, hi), (0, hi)] for (lo, hi), _, _ in bands],
+        facecolors=[to_rgba(color, alpha) for _, color, alpha in bands],
+        edgecolors=[to_rgba(color, alpha) for _, color, alpha in bands], transform=yaxis), autolim=False)
+    
+    # Keep the full 0-25% risk range in view, as the spanning lines and bands don't autoscale
+    ax.update_datalim([(0, 0), (0, 25)], updatex=False)
+    ax.autoscale_view()
+    
+    fig.tight_layout()
+    try:
+        os.makedirs(VIZ_CACHE_DIR, exist_ok=True)
+        fig.savefig(cache_path, dpi=120)
+        _prune_viz_cache()
+    except OSError as e:
+        print(f"   ⚠️  Warning: Could not cache chart: {e}")
     plt.show()
     
     return current_point
@@ -223,42 +474,43 @@ def generate_analysis_summary(df_federal):
     print("=" * 60)
     
     print(f"\n📊 DATASET OVERVIEW:")
-    print(f"   • Time Period: {df_federal.index[0].strftime('%Y-%m')} to {df_federal.index[-1].strftime('%Y-%m')}")
+    print(f"   • Time Period: {str(df_federal.index[0])[:7]} to {str(df_federal.index[-1])[:7]}")
     print(f"   • Total Quarters: {len(df_federal)}")
     
     print(f"\n🔥 KEY FINDINGS:")
-    current_burden = df_federal['interest_burden_pct'].iloc[-1]
-    peak_burden = df_federal['interest_burden_pct'].max()
-    avg_burden = df_federal['interest_burden_pct'].mean()
+    # Materialize the column once and reduce in NumPy (NaNs are already stripped by the fetch/demo cleaning)
+    burden = df_federal['interest_burden_pct'].to_numpy(dtype='float64', na_value=np.nan)
+    current_burden, peak_burden, avg_burden = burden[-1], burden.max(), burden.mean()
+    median_burden, p95_burden, p99_burden = np.nanpercentile(burden, [50, 95, 99])
     
     print(f"   • CURRENT Interest Burden: {current_burden:.2f}% of federal revenue")
     print(f"   • PEAK Interest Burden: {peak_burden:.2f}% (historical maximum)")
     print(f"   • AVERAGE Interest Burden: {avg_burden:.2f}% (34-year average)")
+    print(f"   • MEDIAN Interest Burden: {median_burden:.2f}% (95th pct: {p95_burden:.2f}%, 99th pct: {p99_burden:.2f}%)")
     print(f"   • Current vs Peak: {current_burden/peak_burden*100:.1f}% of historical peak")
     
     # Risk Assessment
-    if current_burden > 20:
-        risk_level = "🚨 CRITICAL"
-    elif current_burden > 15:
-        risk_level = "⚠️  HIGH RISK"
-    elif current_burden > 10:
-        risk_level = "⚡ MODERATE"
-    else:
-        risk_level = "✅ MANAGEABLE"
+    risk_level = classify_series(current_burden)
     
     print(f"\n🎯 RISK ASSESSMENT: {risk_level} ({current_burden:.1f}%)")
     
+    # Risk timeline: quarters spent in each zone
+    risk_timeline = classify_series(burden)
+    print(f"\n📅 RISK TIMELINE ({len(risk_timeline)} quarters):")
+    for label in _RISK_LABELS[::-1]:
+        print(f"   • {label}: {np.count_nonzero(risk_timeline == label)} quarters")
+    
     print("\n" + "=" * 60)
     print("📰 ANALYSIS COMPLETE - Ready for Newsletter Publication!")
     print("=" * 60)
 
 
-def main():
+def main(refresh=False):
     """Main analysis function"""
     print("🚀 Starting Federal Interest Expense Burden Analysis...")
     
-    # Fetch data
-    df_federal = fetch_federal_debt_data()
+    # Fetch data up to the analysis date
+    df_federal = fetch_federal_debt_data(refresh=refresh, now=ANALYSIS_TIME)
     
     # Create visualization
     current_point = create_visualization(df_federal)
@@ -271,4 +523,8 @@ def main():
 
 
 if __name__ == "__main__":
-    df_federal = main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="US Federal Interest Expense Burden analysis")
+    parser.add_argument('--refresh', action='store_true',
+                        help=f"ignore {FEDERAL_DEBT_CACHE} and re-fetch data from FRED")
+    args = parser.parse_args()
+    df_federal = main(refresh=args.refresh)
\ No newline at end of file